@@ -25,7 +25,8 @@ def get_media_duration(file_path: str) -> int | None:
     try:
         duration = ffmpeg.probe(file_path)["format"]["duration"]
         return round(float(duration))
-    except:
+    except (ffmpeg.Error, OSError, KeyError, ValueError) as e:
+        logging.debug(f"Could not determine duration of {file_path}: {e}")
         return None
 
 
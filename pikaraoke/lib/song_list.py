@@ -4,10 +4,36 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 
+def _walk(root: str) -> Iterator[tuple[str, str]]:
+    """Recursively yield (path, name) for every file under root.
+
+    Uses os.scandir so file/dir checks reuse the cached DirEntry type info instead
+    of issuing a stat() per entry. Symlinked directories are not descended into,
+    matching Path.rglob.
+
+    Paths are built the way pathlib joins them, so "." yields bare names and
+    roots such as "/" or "E:/" don't get a doubled slash.
+
+    Args:
+        root: Directory to walk, as returned by Path.as_posix().
+    """
+    prefix = "" if root == "." else root.rstrip("/") + "/"
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk(path)
+                elif entry.is_file():
+                    yield path, entry.name
+    except OSError as e:
+        logging.warning(f"Could not scan directory {root}: {e}")
+
+
 class SongList:
     """A hybrid data structure for efficient song list management.
 
@@ -39,11 +65,13 @@ class SongList:
         """
         self._songs: set[str] = set()
         self._sorted_cache: list[str] | None = None
+        self._search_cache: list[tuple[str, str]] | None = None
         self._sort_key = sort_key or (lambda f: os.path.basename(f).lower())
 
     def _invalidate_cache(self) -> None:
-        """Mark the sorted cache as stale."""
+        """Mark the sorted and search caches as stale."""
         self._sorted_cache = None
+        self._search_cache = None
 
     def _ensure_sorted(self) -> list[str]:
         """Ensure the sorted cache is up to date and return it."""
@@ -51,6 +79,23 @@ class SongList:
             self._sorted_cache = sorted(self._songs, key=self._sort_key)
         return self._sorted_cache
 
+    def search(self, query: str) -> list[str]:
+        """Find songs whose path contains the query, case-insensitively.
+
+        Lowercased paths are cached with the sorted list, so repeated queries
+        (e.g. autocomplete keystrokes) don't re-lowercase the whole library.
+
+        Args:
+            query: Text to look for.
+
+        Returns:
+            Matching song paths in sorted order.
+        """
+        if self._search_cache is None:
+            self._search_cache = [(song.lower(), song) for song in self._ensure_sorted()]
+        query = query.lower()
+        return [song for lowered, song in self._search_cache if query in lowered]
+
     def add(self, song_path: str) -> None:
         """Add a song to the list. O(1) average."""
         if song_path not in self._songs:
@@ -76,8 +121,8 @@ class SongList:
         self._songs.clear()
         self._invalidate_cache()
 
-    def update(self, songs: list[str]) -> None:
-        """Replace all songs with a new list."""
+    def update(self, songs: Iterable[str]) -> None:
+        """Replace all songs with a new collection."""
         self._songs = set(songs)
         self._invalidate_cache()
 
@@ -136,16 +181,20 @@ class SongList:
             Number of songs found.
         """
         logging.info(f"Scanning for songs in: {directory}")
-        files_found = []
-        for file in Path(directory).rglob("*.*"):
-            file_path = file.as_posix()
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in self.VALID_EXTENSIONS and os.path.isfile(file_path):
-                logging.debug(f"Found song: {file.name}")
-                files_found.append(file_path)
+        self.update(self._iter_songs(directory))
+        return len(self)
 
-        self.update(files_found)
-        return len(files_found)
+    def _iter_songs(self, directory: str) -> Iterator[str]:
+        """Yield song paths under a directory as they are discovered.
+
+        Feeding this straight into update() avoids holding a second full copy
+        of the library in a temporary list while scanning.
+        """
+        for file_path, file_name in _walk(Path(directory).as_posix()):
+            ext = os.path.splitext(file_name)[1].lower()
+            if ext in self.VALID_EXTENSIONS:
+                logging.debug(f"Found song: {file_name}")
+                yield file_path
 
     def find_and_add(self, directory: str, pattern: str) -> str | None:
         """Find a file matching a glob pattern and add it to the list.
@@ -119,6 +119,10 @@ class StreamManager:
     def _copy_file(self, src_path: str, dest_path: str) -> bool:
         """Copy a file that doesn't need transcoding.
 
+        Hard-links when source and destination share a filesystem, which avoids
+        rewriting the whole video; falls back to a real copy otherwise (e.g.
+        songs on a FAT-formatted USB drive).
+
         Args:
             src_path: Source file path.
             dest_path: Destination file path.
@@ -126,7 +130,11 @@ class StreamManager:
         Returns:
             True if copy succeeded, False otherwise.
         """
-        shutil.copy(src_path, dest_path)
+        try:
+            os.link(src_path, dest_path)
+        except OSError as e:
+            logging.debug(f"Hard link failed, copying instead: {e}")
+            shutil.copy(src_path, dest_path)
         max_retries = 5
         while max_retries > 0:
             if os.path.exists(dest_path):
@@ -5,7 +5,6 @@ import re
 import shutil
 import string
 import subprocess
-import sys
 import time
 import xml.etree.ElementTree as ET
 import zipfile
@@ -228,9 +227,8 @@ class VLCClient:
     def stop(self):
         try:
             return self.command("pl_stop")
-        except:
-            e = sys.exc_info()[0]
-            logging.warn(
+        except requests.exceptions.RequestException as e:
+            logging.warning(
                 "Track stop: server may have shut down before http return code received: %s" % e
             )
             return
@@ -58,9 +58,10 @@ def browse():
                 if f.isnumeric():
                     result.append(song)
         else:
+            prefix = letter.lower()
             for song in available_songs:
                 f = k.filename_from_path(song).lower()
-                if f.startswith(letter.lower()):
+                if f.startswith(prefix):
                     result.append(song)
         available_songs = result
 
@@ -1,5 +1,7 @@
 """System information and settings page route."""
 
+import logging
+
 import flask_babel
 import psutil
 from flask import Blueprint, jsonify, render_template
@@ -100,7 +102,8 @@ def get_system_stats():
     try:
         # We can afford to block a bit here since it is async
         cpu = str(psutil.cpu_percent(interval=1)) + "%"
-    except:
+    except (NotImplementedError, OSError, psutil.Error) as e:
+        logging.debug(f"CPU usage query failed: {e}")
         cpu = _("CPU usage query unsupported")
 
     # mem
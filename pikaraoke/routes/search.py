@@ -91,17 +91,15 @@ def autocomplete():
                 description: Result type (autocomplete)
     """
     k = get_karaoke_instance()
-    q = request.args.get("q").lower()
-    result = []
-    for each in k.available_songs:
-        if q in each.lower():
-            result.append(
-                {
-                    "path": each,
-                    "fileName": k.filename_from_path(each),
-                    "type": "autocomplete",
-                }
-            )
+    q = request.args.get("q")
+    result = [
+        {
+            "path": each,
+            "fileName": k.filename_from_path(each),
+            "type": "autocomplete",
+        }
+        for each in k.available_songs.search(q)
+    ]
     response = current_app.response_class(response=json.dumps(result), mimetype="application/json")
     return response
 
@@ -141,9 +141,8 @@ def stream_file_path_full(file_path):
         file_size = os.path.getsize(file_path)
         range_header = request.headers.get("Range", None)
         if not range_header:
-            with open(file_path, "rb") as file:
-                file_content = file.read()
-            return Response(file_content, mimetype="video/mp4")
+            # Stream from disk rather than buffering the whole video in memory
+            return send_file(os.path.abspath(file_path), mimetype="video/mp4")
         # Extract range start and end from Range header (e.g., "bytes=0-499")
         range_match = re.search(r"bytes=(\d+)-(\d*)", range_header)
         start, end = range_match.groups()
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+import ffmpeg
 import pytest
 
 from pikaraoke.lib.ffmpeg import (
@@ -131,7 +132,7 @@ class TestGetMediaDuration:
     def test_returns_none_on_probe_error(self):
         """Test that None is returned when probe fails."""
         with patch("pikaraoke.lib.ffmpeg.ffmpeg.probe") as mock_probe:
-            mock_probe.side_effect = Exception("Probe failed")
+            mock_probe.side_effect = ffmpeg.Error("ffprobe", b"", b"Probe failed")
             result = get_media_duration("/path/to/invalid.mp4")
             assert result is None
 
@@ -178,6 +178,33 @@ class TestSongListIteration:
         assert isinstance(copy, list)
 
 
+class TestSongListSearch:
+    """Tests for SongList search operation."""
+
+    def test_search_case_insensitive(self):
+        """Test that search matches regardless of case."""
+        sl = SongList()
+        sl.update(["/songs/Queen - Bohemian Rhapsody.mp4", "/songs/ABBA - Waterloo.mp4"])
+
+        assert sl.search("QUEEN") == ["/songs/Queen - Bohemian Rhapsody.mp4"]
+
+    def test_search_results_sorted(self):
+        """Test that search results follow the sorted list order."""
+        sl = SongList()
+        sl.update(["/songs/b hit.mp4", "/songs/a hit.mp4", "/songs/other.mp4"])
+
+        assert sl.search("hit") == ["/songs/a hit.mp4", "/songs/b hit.mp4"]
+
+    def test_search_cache_invalidated_on_add(self):
+        """Test that songs added after a search are found."""
+        sl = SongList()
+        sl.add("/songs/first.mp4")
+        sl.search("first")
+        sl.add("/songs/first again.mp4")
+
+        assert len(sl.search("first")) == 2
+
+
 class TestSongListRename:
     """Tests for SongList rename operation."""
 
@@ -248,6 +275,40 @@ class TestSongListScanDirectory:
         assert "/old/song.mp4" not in sl
         assert len(sl) == 1
 
+    def test_scan_directory_paths_match_find_and_add(self, tmp_path):
+        """Test that scanned paths use the same form as find_and_add."""
+        sl = SongList()
+        subdir = tmp_path / "subdir"
+        subdir.mkdir()
+        (subdir / "song---dQw4w9WgXcQ.mp4").touch()
+
+        sl.scan_directory(str(tmp_path) + "/")
+
+        assert sl.find_and_add(str(tmp_path), "*---dQw4w9WgXcQ.*") in sl
+        assert len(sl) == 1
+
+    def test_scan_directory_relative_paths_match_find_and_add(self, tmp_path, monkeypatch):
+        """Test that scanning the current directory doesn't prefix paths with './'."""
+        sl = SongList()
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "song---dQw4w9WgXcQ.mp4").touch()
+        subdir = tmp_path / "subdir"
+        subdir.mkdir()
+        (subdir / "other.mp4").touch()
+
+        sl.scan_directory("./")
+
+        assert sl.find_and_add("./", "*---dQw4w9WgXcQ.*") in sl
+        assert set(sl) == {"song---dQw4w9WgXcQ.mp4", "subdir/other.mp4"}
+
+    def test_scan_directory_missing_directory(self, tmp_path):
+        """Test that scanning a missing directory finds nothing."""
+        sl = SongList()
+
+        count = sl.scan_directory(str(tmp_path / "missing"))
+
+        assert count == 0
+
 
 class TestSongListCacheInvalidation:
     """Tests for SongList cache behavior."""
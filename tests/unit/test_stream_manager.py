@@ -181,6 +181,22 @@ class TestStreamManagerCopyFile:
         assert result is True
         assert dest_file.exists()
         assert dest_file.read_bytes() == b"video content"
+        assert os.path.samefile(src_file, dest_file)  # hard-linked, not copied
+
+    def test_copy_file_falls_back_when_link_fails(self, tmp_path):
+        """Test that a failed hard link (e.g. cross-device) falls back to copying."""
+        mock_karaoke = MockKaraokeForStream()
+        sm = StreamManager(mock_karaoke)
+
+        src_file = tmp_path / "source.mp4"
+        src_file.write_bytes(b"video content")
+        dest_file = tmp_path / "dest.mp4"
+
+        with patch("os.link", side_effect=OSError("Invalid cross-device link")):
+            result = sm._copy_file(str(src_file), str(dest_file))
+
+        assert result is True
+        assert dest_file.read_bytes() == b"video content"
 
 
 class TestStreamManagerCheckMp4Buffer:
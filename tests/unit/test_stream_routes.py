@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+import pytest
+import werkzeug
+from flask import Flask
+
+# Monkeypatch werkzeug.__version__ for Flask compatibility if missing
+if not hasattr(werkzeug, "__version__"):
+    werkzeug.__version__ = "3.0.0"
+
+from pikaraoke.routes.stream import stream_bp
+
+
+@pytest.fixture
+def app():
+    """Create a Flask app for testing."""
+    app = Flask(__name__)
+    app.register_blueprint(stream_bp)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+
+class TestStreamFullRoute:
+    """Tests for the /stream/full route."""
+
+    @patch("pikaraoke.routes.stream.get_tmp_dir")
+    def test_full_file_without_range(self, mock_tmp_dir, client, tmp_path):
+        """Test that a request without Range returns the whole file."""
+        mock_tmp_dir.return_value = str(tmp_path)
+        (tmp_path / "123.mp4").write_bytes(b"0123456789")
+
+        response = client.get("/stream/full/123")
+
+        assert response.status_code == 200
+        assert response.mimetype == "video/mp4"
+        assert response.headers["Content-Length"] == "10"
+        assert response.data == b"0123456789"
+
+    @patch("pikaraoke.routes.stream.get_tmp_dir")
+    def test_partial_file_with_range(self, mock_tmp_dir, client, tmp_path):
+        """Test that a Range request returns the requested bytes."""
+        mock_tmp_dir.return_value = str(tmp_path)
+        (tmp_path / "123.mp4").write_bytes(b"0123456789")
+
+        response = client.get("/stream/full/123", headers={"Range": "bytes=2-5"})
+
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == "bytes 2-5/10"
+        assert response.data == b"2345"